@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """Sync local scoreboard.db to fly.io remote server"""
+import http.client
 import json
 import os
 import sqlite3
 import sys
-import urllib.request
-import urllib.error
-from typing import TypedDict
+import urllib.parse
+from typing import Iterator, TypedDict
 from pathlib import Path
 
 # Load .env file if it exists
@@ -23,6 +23,8 @@ def load_env():
 load_env()
 
 REMOTE_URL = "https://stackoverflow-minigame.fly.dev/scoreboard"
+BATCH_URL = f"{REMOTE_URL}/batch"
+BATCH_SIZE = 1000
 LOCAL_DB = "scoreboard.db"
 SECRET = os.environ.get("STACKOVERFLOW_SCOREBOARD_WEBHOOK_SECRET", "")
 
@@ -34,6 +36,31 @@ class ScoreEntry(TypedDict):
     victory: bool
     timestampUtc: str
 
+def to_entry(score: sqlite3.Row) -> ScoreEntry:
+    return {
+        "id": score["id"],
+        "initials": str(score["initials"]),
+        "level": int(score["level"]),
+        "runTimeTicks": int(score["run_time_ticks"]),
+        "victory": bool(score["victory"]),
+        "timestampUtc": str(score["timestamp_utc"])
+    }
+
+def batches(cursor: sqlite3.Cursor, size: int) -> Iterator[list[sqlite3.Row]]:
+    """Stream query results in fixed-size batches without loading them all."""
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        yield rows
+
+def open_connection(url: str) -> http.client.HTTPConnection:
+    """Open one keep-alive connection that is reused for every batch."""
+    parsed = urllib.parse.urlsplit(url)
+    if parsed.scheme == "https":
+        return http.client.HTTPSConnection(parsed.netloc, timeout=30)
+    return http.client.HTTPConnection(parsed.netloc, timeout=30)
+
 def main():
     # Connect to local database
     try:
@@ -48,50 +75,46 @@ def main():
             ORDER BY timestamp_utc
         """)
 
-        scores = cursor.fetchall()
-        conn.close()
-
+        total_count = 0
         success_count = 0
-        for score in scores:
-            entry: ScoreEntry = {
-                "id": score["id"],
-                "initials": str(score["initials"]),
-                "level": int(score["level"]),
-                "runTimeTicks": int(score["run_time_ticks"]),
-                "victory": bool(score["victory"]),
-                "timestampUtc": str(score["timestamp_utc"])
-            }
+        batch_path = urllib.parse.urlsplit(BATCH_URL).path
+        http_conn = open_connection(BATCH_URL)
+        try:
+            for batch in batches(cursor, BATCH_SIZE):
+                total_count += len(batch)
+                # One POST per batch instead of one per score
+                payload = {
+                    "lines": [json.dumps(to_entry(score)) for score in batch]
+                }
 
-            # Create payload
-            payload = {
-                "line": json.dumps(entry)
-            }
-
-            # POST to fly.io
-            try:
-                req = urllib.request.Request(
-                    REMOTE_URL,
-                    data=json.dumps(payload).encode('utf-8'),
-                    headers={
-                        'Content-Type': 'application/json',
-                        'X-Scoreboard-Secret': SECRET
-                    },
-                    method='POST'
-                )
-
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    if response.status in (200, 202):
-                        success_count += 1
-                        print(f"✓ Uploaded: {entry['initials']} - Level {entry['level']}")
+                # POST to fly.io over the shared connection
+                try:
+                    http_conn.request(
+                        "POST",
+                        batch_path,
+                        body=json.dumps(payload).encode('utf-8'),
+                        headers={
+                            'Content-Type': 'application/json',
+                            'X-Scoreboard-Secret': SECRET
+                        }
+                    )
+                    response = http_conn.getresponse()
+                    body = response.read()
+                    if response.status == 200:
+                        stored = json.loads(body).get("stored", 0)
+                        success_count += stored
+                        print(f"✓ Uploaded batch: {stored} scores")
                     else:
-                        print(f"✗ Failed: {entry['initials']} - Status {response.status}")
-
-            except urllib.error.HTTPError as e:
-                print(f"✗ HTTP Error uploading {entry['initials']}: {e.code} {e.reason}")
-            except Exception as e:
-                print(f"✗ Error uploading {entry['initials']}: {e}")
+                        print(f"✗ HTTP Error uploading batch of {len(batch)}: {response.status} {response.reason}")
+                except Exception as e:
+                    # Drop the broken socket; the next request reconnects
+                    http_conn.close()
+                    print(f"✗ Error uploading batch of {len(batch)}: {e}")
+        finally:
+            http_conn.close()
+            conn.close()
 
-        print(f"\n✅ Sync complete: {success_count}/{len(scores)} scores uploaded successfully")
+        print(f"\n✅ Sync complete: {success_count}/{total_count} scores uploaded successfully")
 
     except sqlite3.Error as e:
         print(f"Database error: {e}")
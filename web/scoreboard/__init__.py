@@ -4,8 +4,16 @@ from typing import Any
 
 __all__ = ["run_webhook"]
 
-def run_webhook(*args: Any, **kwargs: Any) -> Any:
-    """Lazy wrapper around :func:`tools.scoreboard.webhook.main`."""
-    from .webhook import main
 
-    return main(*args, **kwargs)
+def __getattr__(name: str) -> Any:
+    """Lazily expose :func:`web.scoreboard.webhook.main` as ``run_webhook``.
+
+    The webhook module opens the database at import, so it is only loaded on
+    first access and then cached in the package namespace.
+    """
+    if name == "run_webhook":
+        from .webhook import main
+
+        globals()["run_webhook"] = main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
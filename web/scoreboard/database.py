@@ -3,23 +3,136 @@ Database repository for scoreboard entries.
 Handles SQLite operations, queries, and statistics.
 """
 
+import queue
+import re
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from types import TracebackType
-from typing import Dict, Optional, Type
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Type
 from .models import ScoreEntryDict
 
+# Extended ISO-8601 date with optional time and UTC offset. The handler
+# lower-cases query values, hence IGNORECASE for the T/Z designators.
+_ISO_TIMESTAMP_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}(?::\d{2}(?::\d{2}(?:\.\d+)?)?)?(?:Z|[+-]\d{2}:?\d{2})?)?",
+    re.ASCII | re.IGNORECASE,
+)
+
 
 class ScoreRepository:
     """
     Repository for managing scoreboard entries in SQLite database.
 
+    Writes go through a single connection guarded by a lock, while
+    leaderboard reads check out one of a small pool of read-only
+    connections so they run concurrently with writes under WAL.
+
     Supports context manager protocol for automatic cleanup:
         with ScoreRepository('scoreboard.db') as repo:
             repo.upsert_entry(entry)
     """
 
+    READER_POOL_SIZE = 4
+    LEADERBOARD_CACHE_TTL = 2.0
+    LEADERBOARD_CACHE_MAX_ENTRIES = 128
+    STATEMENT_CACHE_SIZE = 256
+
+    _UPSERT_SQL = """
+        INSERT INTO scoreboard (id, initials, level, max_altitude, run_time_ticks, victory, timestamp_utc)
+        VALUES (?, ?, ?, 0.0, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            initials=excluded.initials,
+            level=excluded.level,
+            max_altitude=excluded.max_altitude,
+            run_time_ticks=excluded.run_time_ticks,
+            victory=excluded.victory,
+            timestamp_utc=excluded.timestamp_utc
+    """
+
+    # Top levels, fastest (victorious) runs and the stats summary in a
+    # single statement; rows are tagged by kind and split in leaderboard().
+    # Highest level and top player are left NULL because the first
+    # top-levels row already answers them. The fastest player relies
+    # on SQLite's bare-column MIN rule (initials come from the minimum
+    # row), and the unary + keeps the planner off a slow skip-scan of
+    # idx_level_time.
+    _LEADERBOARD_SQL = """
+        SELECT
+            'top' AS kind, id, initials, level, run_time_ticks, victory, timestamp_utc,
+            NULL AS total_players, NULL AS total_runs, NULL AS average_level,
+            NULL AS highest_level, NULL AS fastest_time_ticks,
+            NULL AS top_player, NULL AS fastest_player
+        FROM (
+            SELECT * FROM scoreboard
+            WHERE (:since IS NULL OR timestamp_utc >= :since)
+            ORDER BY level DESC, run_time_ticks ASC
+            LIMIT :limit
+        )
+        UNION ALL
+        SELECT
+            'fast', id, initials, level, run_time_ticks, victory, timestamp_utc,
+            NULL, NULL, NULL, NULL, NULL, NULL, NULL
+        FROM (
+            SELECT * FROM scoreboard
+            WHERE (:since IS NULL OR timestamp_utc >= :since)
+                AND run_time_ticks > 0 AND level > 0 AND victory = 1
+            ORDER BY run_time_ticks ASC, level DESC
+            LIMIT :limit
+        )
+        UNION ALL
+        SELECT
+            'stats', NULL, NULL, NULL, NULL, NULL, NULL,
+            COUNT(DISTINCT initials), COUNT(*), CAST(AVG(level) AS INTEGER),
+            NULL, MIN(CASE WHEN run_time_ticks > 0 THEN run_time_ticks END),
+            NULL,
+            (
+                SELECT initials FROM (
+                    SELECT initials, MIN(run_time_ticks) FROM scoreboard
+                    WHERE (:since IS NULL OR timestamp_utc >= :since)
+                        AND +run_time_ticks > 0
+                )
+            )
+        FROM scoreboard
+        WHERE (:since IS NULL OR timestamp_utc >= :since)
+    """
+
+    # The player subqueries rely on SQLite's bare-column MIN/MAX rule;
+    # see _LEADERBOARD_SQL for the unary +
+    _STATS_SQL = """
+        SELECT
+            COUNT(DISTINCT initials) AS total_players,
+            COUNT(*) AS total_runs,
+            CAST(AVG(level) AS INTEGER) AS average_level,
+            MAX(level) AS highest_level,
+            MIN(CASE WHEN run_time_ticks > 0 THEN run_time_ticks END) AS fastest_time_ticks,
+            (
+                SELECT initials FROM (
+                    SELECT initials, MAX(level) FROM scoreboard
+                    WHERE (:since IS NULL OR timestamp_utc >= :since)
+                )
+            ) AS top_player,
+            (
+                SELECT initials FROM (
+                    SELECT initials, MIN(run_time_ticks) FROM scoreboard
+                    WHERE (:since IS NULL OR timestamp_utc >= :since)
+                        AND +run_time_ticks > 0
+                )
+            ) AS fastest_player
+        FROM scoreboard
+        WHERE (:since IS NULL OR timestamp_utc >= :since)
+    """
+
+    # With a since bound the OR filter above becomes a plain range on
+    # timestamp_utc, which the planner can serve from idx_ts; the OR form
+    # always scans the table.
+    _SINCE_FILTER = "(:since IS NULL OR timestamp_utc >= :since)"
+    _LEADERBOARD_SINCE_SQL = _LEADERBOARD_SQL.replace(_SINCE_FILTER, "timestamp_utc >= :since")
+    _STATS_SINCE_SQL = _STATS_SQL.replace(_SINCE_FILTER, "timestamp_utc >= :since")
+
     def __init__(self, db_path: str):
         """
         Initialize the score repository.
@@ -40,19 +153,137 @@ class ScoreRepository:
 
         self.path = str(resolved)
         self._conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._reader_conns: list[sqlite3.Connection] = []
+        self._reader_uri = ""
+        # Bumped after every committed write; cached leaderboards remember
+        # the version they were built from.
+        self._version = 0
+        self._leaderboard_cache: Dict[
+            tuple[int, Optional[str]], tuple[int, float, Dict[str, object]]
+        ] = {}
 
         try:
-            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            # Write transactions take the RESERVED lock up front (BEGIN
+            # IMMEDIATE) so a concurrent writer such as the sync script makes
+            # us wait on busy_timeout instead of failing mid-transaction.
+            self._conn = sqlite3.connect(
+                self.path,
+                check_same_thread=False,
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+                isolation_level="IMMEDIATE",
+            )
         except sqlite3.Error as exc:
             raise SystemExit(
                 f"Failed to open scoreboard database at {self.path}: {exc}"
             ) from exc
         self._conn.row_factory = sqlite3.Row
+
+        # WAL lets leaderboard reads proceed while a webhook write commits;
+        # it is not supported for in-memory databases.
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        # SQLite silently keeps the old mode when WAL is unavailable (e.g. on
+        # some network filesystems), so record what actually took effect.
+        self.journal_mode = str(self._conn.execute("PRAGMA journal_mode").fetchone()[0])
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._tune(self._conn)
         self._initialize()
+        self._open_readers(self._conn)
+
+    @staticmethod
+    def _tune(conn: sqlite3.Connection) -> None:
+        """Apply the per-connection cache and locking PRAGMAs."""
+        conn.execute("PRAGMA busy_timeout=30000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA mmap_size=268435456")
+
+    def _open_readers(self, writer: sqlite3.Connection) -> None:
+        """Fill the read-only connection pool used by leaderboard queries."""
+        if self.path == ":memory:":
+            # A private in-memory database is only visible to its own
+            # connection, so reads share the writer.
+            self._readers.put(writer)
+            return
+        self._reader_uri = f"{Path(self.path).resolve().as_uri()}?mode=ro"
+        for _ in range(self.READER_POOL_SIZE):
+            try:
+                reader = self._connect_reader()
+            except sqlite3.Error as exc:
+                raise SystemExit(
+                    f"Failed to open scoreboard database at {self.path}: {exc}"
+                ) from exc
+            self._reader_conns.append(reader)
+            self._readers.put(reader)
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        """Open one read-only connection for the reader pool."""
+        reader = sqlite3.connect(
+            self._reader_uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        # Readers hand back plain tuples; the read paths unpack them
+        # positionally instead of looking columns up by name.
+        reader.execute("PRAGMA query_only=1")
+        self._tune(reader)
+        return reader
+
+    def _replace_reader(self, reader: sqlite3.Connection) -> sqlite3.Connection:
+        """
+        Swap a reader that raised for a freshly opened one.
+
+        If the database cannot be reopened right now the old connection is
+        kept so the pool never shrinks.
+        """
+        try:
+            fresh = self._connect_reader()
+        except sqlite3.Error:
+            return reader
+        try:
+            reader.close()
+        except sqlite3.Error:
+            pass  # Ignore errors during cleanup
+        try:
+            self._reader_conns.remove(reader)
+        except ValueError:
+            pass
+        self._reader_conns.append(fresh)
+        return fresh
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Check out a read-only connection for the duration of a query."""
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+        conn = self._readers.get()
+        try:
+            yield conn
+        except sqlite3.Error:
+            # Don't hand a possibly broken connection to the next query
+            if conn is not self._conn:
+                conn = self._replace_reader(conn)
+            raise
+        finally:
+            self._readers.put(conn)
 
     def close(self) -> None:
-        """Close the database connection if it's open."""
+        """Close the database connections if they're open."""
+        for reader in self._reader_conns:
+            try:
+                reader.close()
+            except sqlite3.Error:
+                pass  # Ignore errors during cleanup
+        self._reader_conns.clear()
         if self._conn is not None:
+            try:
+                # Refresh planner statistics before the connection goes away
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             try:
                 self._conn.close()
             except sqlite3.Error:
@@ -79,7 +310,7 @@ class ScoreRepository:
         self.close()
 
     def _initialize(self) -> None:
-        """Create the scoreboard table if it doesn't exist."""
+        """Create the scoreboard table and its leaderboard indexes if missing."""
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
         with self._conn:
@@ -96,6 +327,25 @@ class ScoreRepository:
                 )
                 """
             )
+            # Match the leaderboard ORDER BY clauses so top-N is an index scan
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_level_time
+                ON scoreboard(level DESC, run_time_ticks ASC)
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_time_level
+                ON scoreboard(run_time_ticks ASC, level DESC)
+                WHERE run_time_ticks > 0 AND level > 0
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ts ON scoreboard(timestamp_utc)"
+            )
+        # Refresh planner statistics so the indexes above get picked
+        self._conn.execute("ANALYZE")
 
     def upsert_entry(self, entry: ScoreEntryDict) -> None:
         """
@@ -106,49 +356,92 @@ class ScoreRepository:
         """
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
-        with self._conn:
-            self._conn.execute(
-                """
-                INSERT INTO scoreboard (id, initials, level, max_altitude, run_time_ticks, victory, timestamp_utc)
-                VALUES (:id, :initials, :level, :max_altitude, :run_time_ticks, :victory, :timestamp_utc)
-                ON CONFLICT(id) DO UPDATE SET
-                    initials=excluded.initials,
-                    level=excluded.level,
-                    max_altitude=excluded.max_altitude,
-                    run_time_ticks=excluded.run_time_ticks,
-                    victory=excluded.victory,
-                    timestamp_utc=excluded.timestamp_utc
-                """,
-                {
-                    "id": entry["id"],
-                    "initials": entry["initials"],
-                    "level": entry["level"],
-                    "max_altitude": 0.0,  # DEPRECATED: Legacy field kept for backward compatibility with old clients
-                    "run_time_ticks": entry["runTimeTicks"],
-                    "victory": int(entry["victory"]),
-                    "timestamp_utc": entry["timestampUtc"],
-                },
-            )
+        with self._write_lock:
+            with self._conn:
+                self._conn.execute(self._UPSERT_SQL, self._entry_params(entry))
+            self._invalidate_cache()
+
+    def upsert_many(self, entries: Iterable[ScoreEntryDict]) -> int:
+        """
+        Insert or update several scoreboard entries in a single transaction.
+
+        The statement is prepared once and stepped for every entry, so a
+        batch costs one commit instead of one per row.
+
+        Args:
+            entries: Score entry dictionaries to upsert
+
+        Returns:
+            Number of entries written
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+        with self._write_lock:
+            with self._conn:
+                cursor = self._conn.executemany(
+                    self._UPSERT_SQL, (self._entry_params(entry) for entry in entries)
+                )
+            self._invalidate_cache()
+        return max(cursor.rowcount, 0)
+
+    @staticmethod
+    def _entry_params(entry: ScoreEntryDict) -> tuple[object, ...]:
+        """
+        Map a score entry to the positional parameters of the upsert statement.
+
+        max_altitude is bound as a 0.0 literal in the SQL: it is a deprecated
+        legacy column kept for backward compatibility with old clients.
+        """
+        return (
+            entry["id"],
+            entry["initials"],
+            entry["level"],
+            entry["runTimeTicks"],
+            1 if entry["victory"] else 0,
+            entry["timestampUtc"],
+        )
+
+    def maintain(self) -> None:
+        """
+        Run periodic housekeeping on the writer connection.
+
+        Folds committed WAL frames back into the database without waiting
+        on readers and refreshes query planner statistics.
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+        with self._write_lock:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            self._conn.execute("PRAGMA optimize")
+
+    @property
+    def version(self) -> int:
+        """Counter bumped after every committed write."""
+        return self._version
+
+    def _invalidate_cache(self) -> None:
+        """Make cached leaderboards stale after a write."""
+        self._version += 1
+        self._leaderboard_cache.clear()
 
     def _validate_timestamp(self, ts: Optional[str]) -> Optional[str]:
         """
         Validate that a timestamp string is a valid ISO format.
 
+        Only the shape is checked; the value is bound as a parameter and
+        compared as text, so it never needs to become a datetime.
+
         Args:
             ts: Timestamp string to validate
 
         Returns:
             Validated timestamp string or None if invalid
         """
-        if not ts:
-            return None
-        try:
-            # Validate it's a valid ISO timestamp
-            datetime.fromisoformat(ts)
+        if ts and _ISO_TIMESTAMP_RE.fullmatch(ts):
             return ts
-        except (ValueError, TypeError):
-            # Invalid format, ignore the filter
-            return None
+        # Invalid format, ignore the filter
+        return None
 
     def leaderboard(
         self, limit: int, since: Optional[str] = None
@@ -168,60 +461,81 @@ class ScoreRepository:
         # Validate timestamp to prevent SQL injection
         since_validated = self._validate_timestamp(since)
 
-        if self._conn is None:
-            raise RuntimeError("Database connection not initialized")
-
-        with self._conn:
-            # Top levels query - use conditional execution instead of f-strings
-            if since_validated:
-                top_query = """
-                    SELECT * FROM scoreboard
-                    WHERE timestamp_utc >= ?
-                    ORDER BY level DESC, run_time_ticks ASC
-                    LIMIT ?
-                """
-                top_rows = self._conn.execute(top_query, (since_validated, limit)).fetchall()
-            else:
-                top_query = """
-                    SELECT * FROM scoreboard
-                    ORDER BY level DESC, run_time_ticks ASC
-                    LIMIT ?
-                """
-                top_rows = self._conn.execute(top_query, (limit,)).fetchall()
-
-            # Fastest runs query - only show victorious runs
-            if since_validated:
-                fast_query = """
-                    SELECT * FROM scoreboard
-                    WHERE timestamp_utc >= ? AND run_time_ticks > 0 AND level > 0 AND victory = 1
-                    ORDER BY run_time_ticks ASC, level DESC
-                    LIMIT ?
-                """
-                fast_rows = self._conn.execute(fast_query, (since_validated, limit)).fetchall()
-            else:
-                fast_query = """
-                    SELECT * FROM scoreboard
-                    WHERE run_time_ticks > 0 AND level > 0 AND victory = 1
-                    ORDER BY run_time_ticks ASC, level DESC
-                    LIMIT ?
-                """
-                fast_rows = self._conn.execute(fast_query, (limit,)).fetchall()
-
-            # Count query
-            if since_validated:
-                count_query = "SELECT COUNT(*) AS count FROM scoreboard WHERE timestamp_utc >= ?"
-                count_row = self._conn.execute(count_query, (since_validated,)).fetchone()
+        params = {"since": since_validated, "limit": limit}
+        with self._reader() as conn:
+            rows = conn.execute(
+                self._LEADERBOARD_SQL if since_validated is None else self._LEADERBOARD_SINCE_SQL,
+                params,
+            ).fetchall()
+
+        # Rows are plain tuples: kind, the six entry columns, then the
+        # seven stats columns (NULL outside the stats row).
+        top_levels: list[ScoreEntryDict] = []
+        fastest_runs: list[ScoreEntryDict] = []
+        stats_row = None
+        for row in rows:
+            kind = row[0]
+            if kind == "stats":
+                stats_row = row[7:]
+                continue
+            _, entry_id, initials, level, run_time_ticks, victory, timestamp_utc = row[:7]
+            entry: ScoreEntryDict = {
+                "id": entry_id,
+                "initials": initials,
+                "level": level,
+                "runTimeTicks": run_time_ticks,
+                "victory": bool(victory),
+                "timestampUtc": timestamp_utc,
+            }
+            if kind == "top":
+                top_levels.append(entry)
             else:
-                count_query = "SELECT COUNT(*) AS count FROM scoreboard"
-                count_row = self._conn.execute(count_query).fetchone()
+                fastest_runs.append(entry)
 
+        stats = self._stats_from_row(stats_row)
+        if top_levels:
+            # Ordered by level DESC, so the first row holds the highest level
+            stats["highestLevel"] = top_levels[0]["level"]
+            stats["topPlayer"] = top_levels[0]["initials"]
         return {
-            "count": count_row["count"] if count_row else 0,
-            "topLevels": [self._row_to_entry(row) for row in top_rows],
-            "fastestRuns": [self._row_to_entry(row) for row in fast_rows],
-            "stats": self.get_global_stats(since_validated),
+            "count": stats["totalRuns"],
+            "topLevels": top_levels,
+            "fastestRuns": fastest_runs,
+            "stats": stats,
         }
 
+    def leaderboard_cached(
+        self, limit: int, since: Optional[str] = None, ttl: Optional[float] = None
+    ) -> Dict[str, object]:
+        """
+        Get leaderboard data, reusing a recent result when nothing changed.
+
+        Results are kept for ``ttl`` seconds and dropped as soon as a write
+        commits. The returned dictionary is shared and must not be mutated.
+
+        Args:
+            limit: Maximum number of entries to return (1-100)
+            since: Optional ISO timestamp to filter by time range
+            ttl: Cache lifetime in seconds (defaults to LEADERBOARD_CACHE_TTL)
+
+        Returns:
+            Dictionary containing count, topLevels, fastestRuns, and stats
+        """
+        if ttl is None:
+            ttl = self.LEADERBOARD_CACHE_TTL
+        key = (limit, since)
+        version = self._version
+        now = time.monotonic()
+        cached = self._leaderboard_cache.get(key)
+        if cached is not None and cached[0] == version and now - cached[1] < ttl:
+            return cached[2]
+
+        payload = self.leaderboard(limit, since)
+        if len(self._leaderboard_cache) >= self.LEADERBOARD_CACHE_MAX_ENTRIES:
+            self._leaderboard_cache.clear()
+        self._leaderboard_cache[key] = (version, now, payload)
+        return payload
+
     def get_global_stats(self, since: Optional[str] = None) -> Dict[str, object]:
         """
         Get global statistics for all scoreboard entries.
@@ -235,115 +549,45 @@ class ScoreRepository:
         # Validate timestamp
         since_validated = self._validate_timestamp(since)
 
-        if self._conn is None:
-            raise RuntimeError("Database connection not initialized")
+        with self._reader() as conn:
+            stats_row = conn.execute(
+                self._STATS_SQL if since_validated is None else self._STATS_SINCE_SQL,
+                {"since": since_validated},
+            ).fetchone()
 
-        with self._conn:
-            # Get basic stats - use conditional execution
-            if since_validated:
-                stats_query = """
-                    SELECT
-                        COUNT(DISTINCT initials) as total_players,
-                        COUNT(*) as total_runs,
-                        CAST(AVG(level) AS INTEGER) as average_level,
-                        MAX(level) as highest_level,
-                        MIN(CASE WHEN run_time_ticks > 0 THEN run_time_ticks END) as fastest_time_ticks
-                    FROM scoreboard
-                    WHERE timestamp_utc >= ?
-                """
-                stats_row = self._conn.execute(stats_query, (since_validated,)).fetchone()
-            else:
-                stats_query = """
-                    SELECT
-                        COUNT(DISTINCT initials) as total_players,
-                        COUNT(*) as total_runs,
-                        CAST(AVG(level) AS INTEGER) as average_level,
-                        MAX(level) as highest_level,
-                        MIN(CASE WHEN run_time_ticks > 0 THEN run_time_ticks END) as fastest_time_ticks
-                    FROM scoreboard
-                """
-                stats_row = self._conn.execute(stats_query).fetchone()
-
-            if not stats_row or stats_row["total_runs"] == 0:
-                return {
-                    "totalPlayers": 0,
-                    "totalRuns": 0,
-                    "averageLevel": 0,
-                    "highestLevel": 0,
-                    "fastestTimeTicks": 0,
-                    "topPlayer": "N/A",
-                    "fastestPlayer": "N/A",
-                }
-
-            # Get top player
-            if since_validated:
-                top_player_query = """
-                    SELECT initials, MAX(level) as max_level
-                    FROM scoreboard
-                    WHERE timestamp_utc >= ?
-                    GROUP BY initials
-                    ORDER BY max_level DESC
-                    LIMIT 1
-                """
-                top_player_row = self._conn.execute(top_player_query, (since_validated,)).fetchone()
-            else:
-                top_player_query = """
-                    SELECT initials, MAX(level) as max_level
-                    FROM scoreboard
-                    GROUP BY initials
-                    ORDER BY max_level DESC
-                    LIMIT 1
-                """
-                top_player_row = self._conn.execute(top_player_query).fetchone()
-
-            # Get fastest player
-            if since_validated:
-                fastest_player_query = """
-                    SELECT initials
-                    FROM scoreboard
-                    WHERE timestamp_utc >= ? AND run_time_ticks > 0
-                    ORDER BY run_time_ticks ASC
-                    LIMIT 1
-                """
-                fastest_player_row = self._conn.execute(fastest_player_query, (since_validated,)).fetchone()
-            else:
-                fastest_player_query = """
-                    SELECT initials
-                    FROM scoreboard
-                    WHERE run_time_ticks > 0
-                    ORDER BY run_time_ticks ASC
-                    LIMIT 1
-                """
-                fastest_player_row = self._conn.execute(fastest_player_query).fetchone()
-
-        return {
-            "totalPlayers": stats_row["total_players"] or 0,
-            "totalRuns": stats_row["total_runs"] or 0,
-            "averageLevel": stats_row["average_level"] or 0,
-            "highestLevel": stats_row["highest_level"] or 0,
-            "fastestTimeTicks": stats_row["fastest_time_ticks"] or 0,
-            "topPlayer": top_player_row["initials"] if top_player_row else "N/A",
-            "fastestPlayer": (
-                fastest_player_row["initials"] if fastest_player_row else "N/A"
-            ),
-        }
+        return self._stats_from_row(stats_row)
 
     @staticmethod
-    def _row_to_entry(row: sqlite3.Row) -> ScoreEntryDict:
+    def _stats_from_row(row: Optional[Sequence[object]]) -> Dict[str, object]:
         """
-        Convert a database row to a ScoreEntryDict.
+        Convert a stats summary row to the public statistics dictionary.
 
         Args:
-            row: SQLite row object
+            row: Tuple of total_players, total_runs, average_level,
+                highest_level, fastest_time_ticks, top_player and
+                fastest_player, or None
 
         Returns:
-            ScoreEntryDict with entry data
+            Dictionary containing global statistics
         """
+        if not row or not row[1]:
+            return {
+                "totalPlayers": 0,
+                "totalRuns": 0,
+                "averageLevel": 0,
+                "highestLevel": 0,
+                "fastestTimeTicks": 0,
+                "topPlayer": "N/A",
+                "fastestPlayer": "N/A",
+            }
+        (total_players, total_runs, average_level, highest_level,
+         fastest_time_ticks, top_player, fastest_player) = row
         return {
-            "id": row["id"],
-            "initials": row["initials"],
-            "level": row["level"],
-            "runTimeTicks": row["run_time_ticks"],
-            "victory": bool(row["victory"]),
-            "timestampUtc": row["timestamp_utc"],
+            "totalPlayers": total_players or 0,
+            "totalRuns": total_runs or 0,
+            "averageLevel": average_level or 0,
+            "highestLevel": highest_level or 0,
+            "fastestTimeTicks": fastest_time_ticks or 0,
+            "topPlayer": top_player or "N/A",
+            "fastestPlayer": fastest_player or "N/A",
         }
@@ -1,28 +1,58 @@
 import base64
-import html
+import hashlib
+import http.client
 import json
 import logging
 import os
+import queue
+import random
 import secrets
+import socket
 import sqlite3
+import threading
 import time
 import uuid
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from socketserver import ThreadingMixIn
-from typing import Dict, Iterable, Optional, cast
-from urllib import error as urlerror
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union, cast
 from urllib import parse as urlparse
-from urllib import request as urlrequest
 
 from .database import ScoreRepository
 from .models import ScoreEntryDict
 
+# Both codecs are bound to these names so either one type-checks the same way
+JsonInput = Union[bytes, bytearray, memoryview, str]
+_json_loads: Callable[[JsonInput], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    def _stdlib_json_loads(data: JsonInput) -> Any:
+        # orjson parses memoryviews in place; the stdlib needs real bytes
+        if isinstance(data, memoryview):
+            return json.loads(data.tobytes())
+        return json.loads(data)
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = _stdlib_json_loads
+    _json_dumps = _stdlib_json_dumps
+
 EntryMapping = Dict[str, object]
+# A submitted scoreboard line: text when sent as "line", UTF-8 bytes when
+# decoded from "line_b64".
+ScoreLine = Union[str, bytes]
 
 
 
@@ -37,7 +67,37 @@ API_ENV = "SCOREBOARD_API_BASE"
 DB_ENV = "SCOREBOARD_DB_PATH"
 DEFAULT_DB_PATH = "scoreboard.db"
 LEADERBOARD_LIMIT_ENV = "SCOREBOARD_LEADERBOARD_LIMIT"
+HTTP_THREADS_ENV = "SCOREBOARD_HTTP_THREADS"
+# Multi-entry "lines_b64" payloads need a workflow that understands them, so
+# they are opt-in; by default every entry is its own "line_b64" dispatch.
+DISPATCH_BATCH_ENV = "SCOREBOARD_DISPATCH_BATCH"
+RCVBUF_ENV = "SCOREBOARD_RCVBUF"
+SNDBUF_ENV = "SCOREBOARD_SNDBUF"
 MAX_PAYLOAD_BYTES = 4096
+MAX_BATCH_PAYLOAD_BYTES = 1024 * 1024
+MAX_BATCH_LINES = 5000
+# Accepted POSTs wait here for the background writer; when it is full the
+# endpoint answers 503 instead of blocking an HTTP thread.
+WRITE_QUEUE_MAX = 1024
+WRITE_BATCH_MAX = 64
+CLEANUP_INTERVAL_SECONDS = 300  # 5 minutes
+MAINTENANCE_INTERVAL_SECONDS = 900  # 15 minutes
+# Keeps a coalesced repository_dispatch payload well under GitHub's size cap
+DISPATCH_BATCH_MAX = 20
+# How long a dispatch worker waits for more stored entries to join a chunk
+# (only when batching is enabled via SCOREBOARD_DISPATCH_BATCH)
+DISPATCH_COALESCE_SECONDS = 0.25
+# Stored entries are forwarded to GitHub by their own small thread pool so a
+# slow or retrying API call never holds up the next database commit.
+DISPATCH_QUEUE_MAX = 256
+DISPATCH_WORKERS = 2
+# 4xx responses worth retrying: timeouts, too-early and rate limiting
+RETRYABLE_CLIENT_ERRORS = frozenset({408, 425, 429})
+RETRY_AFTER_MAX_SECONDS = 60.0
+# Game clients resend an entry when they miss the response; identical lines
+# seen within this window are acknowledged without being stored again.
+RECENT_SUBMISSIONS_MAX = 512
+DUPLICATE_WINDOW_SECONDS = 300
 
 logging.basicConfig(level=logging.INFO,
                     format="%(asctime)s %(levelname)s %(message)s")
@@ -51,6 +111,8 @@ class Config:
     event_type: str
     api_base: str
     secret: Optional[str]
+    # Hashed once so each auth check compares two fixed-length digests
+    secret_digest: Optional[bytes] = field(default=None, repr=False)
 
     def __str__(self) -> str:
         """Safe string representation that masks secrets."""
@@ -70,6 +132,10 @@ def _normalize(value: Optional[str]) -> Optional[str]:
     return trimmed or None
 
 
+def _secret_digest(value: bytes) -> bytes:
+    return hashlib.blake2b(value, digest_size=32).digest()
+
+
 def load_config() -> Config:
     repo = _normalize(os.environ.get(REPO_ENV))
     token = _normalize(os.environ.get(TOKEN_ENV))
@@ -82,51 +148,152 @@ def load_config() -> Config:
     api_base = (_normalize(os.environ.get(API_ENV))
                 or "https://api.github.com").rstrip("/")
     secret = _normalize(os.environ.get(SECRET_ENV))
-    return Config(repo=repo, token=token, event_type=event_type, api_base=api_base, secret=secret)
+    return Config(repo=repo, token=token, event_type=event_type, api_base=api_base, secret=secret,
+                  secret_digest=_secret_digest(secret.encode("utf-8")) if secret else None)
 
 
 CONFIG = load_config()
 
+# Static parts of the repository_dispatch bodies, serialized once:
+# {"event_type": ..., "client_payload": {"line_b64": <line>}} for one entry
+# and {"event_type": ..., "client_payload": {"lines_b64": [<line>, ...]}}
+# when several queued entries are forwarded together.
+_DISPATCH_BODY_PREFIX = (
+    '{"event_type": ' + json.dumps(CONFIG.event_type)
+    + ', "client_payload": {"line_b64": '
+).encode("utf-8")
+_DISPATCH_BATCH_BODY_PREFIX = (
+    '{"event_type": ' + json.dumps(CONFIG.event_type)
+    + ', "client_payload": {"lines_b64": '
+).encode("utf-8")
+# The target URL and request headers are just as fixed for the process lifetime
+_DISPATCH_URL: Optional[urlparse.ParseResult] = (
+    urlparse.urlparse(f"{CONFIG.api_base}/repos/{CONFIG.repo.strip('/')}/dispatches")
+    if CONFIG.repo else None
+)
+_DISPATCH_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "Authorization": f"token {CONFIG.token}",
+    "Content-Type": "application/json",
+    "User-Agent": "stackoverflow-minigame-webhook/1.0",
+}
+
 # Simple rate limiter for bot protection
 class RateLimiter:
+    LOCK_STRIPES = 16  # power of two so the shard is a mask of the hash
+
     def __init__(self, max_requests: int = 60, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: Dict[str, list[float]] = defaultdict(list)
+        self._refill_per_ns = max_requests / (window_seconds * 1_000_000_000)
+        # Token bucket per IP: [tokens left, monotonic ns of the last refill].
+        # A bucket holds up to max_requests tokens and refills at
+        # max_requests per window, so state stays two numbers per client.
+        # Buckets are sharded by IP hash, each shard with its own lock and
+        # dict, so unrelated clients never touch the same lock or table.
+        self._shards: list[Tuple[threading.Lock, Dict[str, list[float]]]] = [
+            (threading.Lock(), {}) for _ in range(self.LOCK_STRIPES)
+        ]
 
     def is_allowed(self, client_ip: str) -> bool:
-        now = time.time()
-        cutoff = now - self.window_seconds
-
-        # Clean old requests
-        self.requests[client_ip] = [
-            timestamp for timestamp in self.requests[client_ip]
-            if timestamp > cutoff
-        ]
+        now = time.monotonic_ns()
+
+        lock, buckets = self._shards[hash(client_ip) & (self.LOCK_STRIPES - 1)]
+        with lock:
+            bucket = buckets.get(client_ip)
+            if bucket is None:
+                bucket = buckets[client_ip] = [float(self.max_requests), now]
+
+            # Refill for the time since the last request
+            tokens = min(
+                float(self.max_requests),
+                bucket[0] + (now - bucket[1]) * self._refill_per_ns,
+            )
+            bucket[1] = now
 
-        # Check if limit exceeded
-        if len(self.requests[client_ip]) >= self.max_requests:
-            return False
+            # Check if limit exceeded
+            if tokens < 1:
+                bucket[0] = tokens
+                return False
 
-        # Add current request
-        self.requests[client_ip].append(now)
-        return True
+            # Spend a token on the current request
+            bucket[0] = tokens - 1
+            return True
 
     def cleanup_old_entries(self):
         """Periodically clean up old IP entries to prevent memory buildup"""
-        now = time.time()
-        cutoff = now - (self.window_seconds * 2)
+        # A bucket idle for a whole window has refilled completely and is
+        # indistinguishable from a new one.
+        cutoff = time.monotonic_ns() - self.window_seconds * 1_000_000_000
 
-        for ip in list(self.requests.keys()):
-            self.requests[ip] = [
-                timestamp for timestamp in self.requests[ip]
-                if timestamp > cutoff
-            ]
-            if not self.requests[ip]:
-                del self.requests[ip]
+        for lock, buckets in self._shards:
+            with lock:
+                stale = [ip for ip, bucket in buckets.items() if bucket[1] <= cutoff]
+                for ip in stale:
+                    del buckets[ip]
 
 RATE_LIMITER = RateLimiter(max_requests=60, window_seconds=60)
 
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is refused because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stops calling an upstream for a while after repeated failures.
+
+    Once ``failure_threshold`` consecutive calls fail the circuit opens and
+    calls are refused for ``reset_seconds``. After that a single trial call is
+    let through; success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def seconds_until_retry(self) -> float:
+        """Return how long until the next call will be let through."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_seconds - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_seconds:
+                return False
+            # Let this call probe the upstream; others wait out a new period
+            self._opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    LOGGER.warning("GitHub dispatch circuit opened after %d consecutive failures",
+                                   self._failures)
+                self._opened_at = time.monotonic()
+
+
+DISPATCH_BREAKER = CircuitBreaker(failure_threshold=5, reset_seconds=30.0)
+
 def resolve_db_path() -> str:
     env_path = _normalize(os.environ.get(DB_ENV))
     if env_path:
@@ -144,6 +311,44 @@ def resolve_leaderboard_limit() -> int:
         return 10
 
 
+def resolve_http_threads() -> int:
+    # Workers mostly wait on sockets, so the pool is not sized by CPU count;
+    # a 1-CPU VM would otherwise get only a handful of slots.
+    default = 32
+    raw = _normalize(os.environ.get(HTTP_THREADS_ENV))
+    if not raw:
+        return default
+    try:
+        return max(1, int(raw))
+    except (TypeError, ValueError):
+        return default
+
+
+def resolve_dispatch_chunk_size() -> int:
+    """Return how many entries may share one repository_dispatch (1 unless opted in)."""
+    raw = _normalize(os.environ.get(DISPATCH_BATCH_ENV))
+    if raw and raw.lower() in ("1", "true", "yes", "y"):
+        return DISPATCH_BATCH_MAX
+    return 1
+
+
+def resolve_socket_buffer(env_name: str) -> Optional[int]:
+    """Read an explicit socket buffer size in bytes, or None to keep the OS default.
+
+    Setting SO_RCVBUF/SO_SNDBUF turns off Linux's TCP buffer autotuning for
+    those sockets, so it only helps on hosts whose defaults are too small.
+    """
+    raw = _normalize(os.environ.get(env_name))
+    if not raw:
+        return None
+    try:
+        size = int(raw)
+    except (TypeError, ValueError):
+        LOGGER.warning("Ignoring invalid %s=%r", env_name, raw)
+        return None
+    return size if size > 0 else None
+
+
 try:
     REPOSITORY = ScoreRepository(resolve_db_path())
 except SystemExit:
@@ -152,6 +357,32 @@ except Exception as exc:  # noqa: BLE001
     LOGGER.error("Unable to initialize the scoreboard repository: %s", exc)
     raise SystemExit(1) from exc
 LEADERBOARD_LIMIT_DEFAULT = resolve_leaderboard_limit()
+DISPATCH_CHUNK_SIZE = resolve_dispatch_chunk_size()
+
+
+def _resolve_limit(value: str) -> int:
+    """Clamp a ``limit`` query value to 1-100, falling back to the default."""
+    try:
+        return max(1, min(100, int(value)))
+    except ValueError:
+        return LEADERBOARD_LIMIT_DEFAULT
+
+
+# Relative ``since`` keywords mapped to the window start for a UTC "now"
+_RELATIVE_SINCE: Dict[str, Callable[[datetime], datetime]] = {
+    "today": lambda now: now.replace(hour=0, minute=0, second=0, microsecond=0),
+    "week": lambda now: now - timedelta(days=7),
+    "month": lambda now: now - timedelta(days=30),
+}
+
+
+def _unquote(value: str) -> str:
+    """Decode a query value, skipping the work when nothing is escaped."""
+    if "%" in value or "+" in value:
+        return urlparse.unquote_plus(value)
+    return value
+
+
 TEMPLATE_PATH = Path(__file__).parent / "templates" / "leaderboard.html"
 try:
     HTML_TEMPLATE = TEMPLATE_PATH.read_text(encoding="utf-8")
@@ -160,24 +391,104 @@ except FileNotFoundError as exc:
     raise SystemExit(1) from exc
 
 
+def _split_template(template: str) -> Tuple[bytes, bytes, bytes]:
+    """Split the template into the static byte runs around the two tables."""
+    head, rest = template.encode("utf-8").split(b"{{TOP_LEVELS}}", 1)
+    middle, tail = rest.split(b"{{FASTEST_RUNS}}", 1)
+    return head, middle, tail
+
+
+try:
+    HTML_PREFIX, HTML_MIDDLE, HTML_SUFFIX = _split_template(HTML_TEMPLATE)
+except ValueError as exc:
+    LOGGER.error("Leaderboard template at %s is missing a table marker", TEMPLATE_PATH)
+    raise SystemExit(1) from exc
+
+SECURITY_HEADERS: Tuple[Tuple[str, str], ...] = (
+    # HSTS - Force HTTPS for 1 year (only applies if served over HTTPS)
+    ("Strict-Transport-Security", "max-age=31536000; includeSubDomains"),
+    # Prevent MIME type sniffing
+    ("X-Content-Type-Options", "nosniff"),
+    # Prevent clickjacking
+    ("X-Frame-Options", "DENY"),
+    # XSS Protection (legacy but still good)
+    ("X-XSS-Protection", "1; mode=block"),
+    # Referrer policy
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    # Permissions policy - disable unnecessary features
+    ("Permissions-Policy",
+     "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
+     "magnetometer=(), microphone=(), payment=(), usb=()"),
+)
+
+HTML_CONTENT_SECURITY_POLICY = (
+    "default-src 'none'; "
+    "script-src 'unsafe-inline'; "
+    "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; "
+    "img-src 'self' data: https://api.qrserver.com; "
+    "font-src 'self' https://fonts.gstatic.com; "
+    "connect-src 'self'"
+)
+
+# Rendered leaderboard responses keyed by (kind, raw query string). Each
+# entry remembers the repository version it was built from so a write makes
+# it stale; relative ``since`` windows are additionally bounded by the TTL.
+RESPONSE_CACHE_MAX_ENTRIES = 64
+_RESPONSE_CACHE: "OrderedDict[Tuple[str, str], Tuple[int, float, str, bytes]]" = (
+    OrderedDict()
+)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RECENT_SUBMISSIONS: "OrderedDict[bytes, float]" = OrderedDict()
+_RECENT_SUBMISSIONS_LOCK = threading.Lock()
+# Same replacements as html.escape(quote=True), applied in one translate pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+# Per-thread request body buffers, see ScoreboardHandler._read_json_body.
+_READ_BUFFERS = threading.local()
+
+_MISSING = object()
+
+
+_SQLITE_INT_MIN = -(2 ** 63)
+_SQLITE_INT_MAX = 2 ** 63 - 1
+
+
 def normalize_entry(data: Dict[str, object]) -> ScoreEntryDict:
+    """Coerce a submitted entry into the stored shape.
+
+    Raises:
+        ValueError: If a numeric field does not fit in a SQLite INTEGER.
+    """
     entry_id = str(data.get("id") or uuid.uuid4().hex)
     initials_raw = str(data.get("initials") or "???")
     initials = initials_raw.strip().upper() or "???"
     initials = initials[:3]
-    level_value = data.get("level", data.get("score", 0))
-    run_time_value = data.get("runTimeTicks", data.get("run_time_ticks", 0))
+    # Legacy key names are only looked up when the current one is absent
+    level_value = data.get("level", _MISSING)
+    if level_value is _MISSING:
+        level_value = data.get("score", 0)
+    run_time_value = data.get("runTimeTicks", _MISSING)
+    if run_time_value is _MISSING:
+        run_time_value = data.get("run_time_ticks", 0)
     # max_altitude_value = data.get("maxAltitude", data.get("max_altitude", 0.0))  # REMOVED - No longer needed
     victory_value = data.get("victory", False)
     timestamp = data.get("timestampUtc") or datetime.now(timezone.utc).isoformat()
-    try:
-        level = int(str(level_value))
-    except (TypeError, ValueError):
-        level = 0
-    try:
-        run_time_ticks = int(str(run_time_value))
-    except (TypeError, ValueError):
-        run_time_ticks = 0
+    # JSON numbers arrive as ints already; only other types go through str().
+    # bool is an int subclass, so the check is on the exact type.
+    level = level_value if type(level_value) is int else _coerce_int(level_value)
+    run_time_ticks = (
+        run_time_value if type(run_time_value) is int else _coerce_int(run_time_value)
+    )
+    # SQLite INTEGER is a signed 64-bit value; larger ints fail the insert
+    if not _SQLITE_INT_MIN <= level <= _SQLITE_INT_MAX:
+        raise ValueError("level is out of range.")
+    if not _SQLITE_INT_MIN <= run_time_ticks <= _SQLITE_INT_MAX:
+        raise ValueError("runTimeTicks is out of range.")
     # try:
     #     max_altitude = float(str(max_altitude_value))
     # except (TypeError, ValueError):
@@ -194,40 +505,101 @@ def normalize_entry(data: Dict[str, object]) -> ScoreEntryDict:
     }
 
 
+def _coerce_int(value: object) -> int:
+    try:
+        return int(str(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "y"})
+
+
 def _to_bool(value: object) -> bool:
-    if isinstance(value, bool):
+    # JSON booleans and already-canonical strings skip the generic checks
+    if type(value) is bool:
         return value
+    if type(value) is str and value in _TRUE_STRINGS:
+        return True
     if isinstance(value, (int, float)):
         return value != 0
     if isinstance(value, str):
-        return value.strip().lower() in {"1", "true", "yes", "y"}
+        return value.strip().lower() in _TRUE_STRINGS
     return False
 
 
 class ScoreboardHandler(BaseHTTPRequestHandler):
     server_version = "ScoreboardWebhook/1.0"
+    # Every success response carries Content-Length, so the batch endpoint
+    # used by scripts/sync_scores.py can reuse its connection (see parse_request)
+    protocol_version = "HTTP/1.1"
+    # Drop clients that stall mid-request so they can't pin a pool worker
+    timeout = 5
+
+    def setup(self) -> None:
+        super().setup()
+        # Payloads and responses are tiny; don't let Nagle hold them back
+        try:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+
+    @property
+    def _pool_server(self) -> "ThreadingHTTPServer":
+        return cast("ThreadingHTTPServer", self.server)
+
+    def handle_one_request(self) -> None:
+        # The deadline runs until the body is read (see _read_json_body) or,
+        # for requests without one, until the response has been written.
+        self._pool_server.start_read_deadline(self.connection)
+        try:
+            super().handle_one_request()
+        finally:
+            self._pool_server.clear_read_deadline(self.connection)
+
+    def parse_request(self) -> bool:
+        if not super().parse_request():
+            return False
+        if self._pool_server.read_deadline_expired(self.connection):
+            LOGGER.warning("Dropping request from %s: headers not received in time",
+                           self.client_address[0])
+            self.close_connection = True
+            return False
+        # An idle keep-alive connection pins a pool worker until it times out,
+        # so only the bulk-seeding endpoint keeps the connection open.
+        if self.path != "/scoreboard/batch":
+            self.close_connection = True
+        return True
 
     def _add_security_headers(self) -> None:
         """Add security headers to all responses."""
-        # HSTS - Force HTTPS for 1 year (only applies if served over HTTPS)
-        self.send_header("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
-
-        # Prevent MIME type sniffing
-        self.send_header("X-Content-Type-Options", "nosniff")
-
-        # Prevent clickjacking
-        self.send_header("X-Frame-Options", "DENY")
-
-        # XSS Protection (legacy but still good)
-        self.send_header("X-XSS-Protection", "1; mode=block")
-
-        # Referrer policy
-        self.send_header("Referrer-Policy", "strict-origin-when-cross-origin")
-
-        # Permissions policy - disable unnecessary features
-        self.send_header("Permissions-Policy",
-                        "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
-                        "magnetometer=(), microphone=(), payment=(), usb=()")
+        for name, value in SECURITY_HEADERS:
+            self.send_header(name, value)
+
+    def _send_preformatted(
+        self,
+        head: bytes,
+        body: bytes,
+        etag: Optional[str] = None,
+        status: HTTPStatus = HTTPStatus.OK,
+    ) -> None:
+        """Write a response whose status line and fixed headers were serialized at import.
+
+        Only the ETag, Date and Content-Length are formatted per request, and
+        the whole response goes out in a single write. ``status`` is only used
+        for the access log and must match the one ``head`` was built with.
+        """
+        self.log_request(status)
+        self.wfile.write(b"".join((
+            head,
+            b"ETag: " + etag.encode("ascii") + b"\r\n" if etag else b"",
+            b"Connection: close\r\n" if self.close_connection else b"",
+            b"Date: ", self.date_time_string().encode("ascii"),
+            b"\r\nContent-Length: ", str(len(body)).encode("ascii"),
+            b"\r\n\r\n",
+            body,
+        )))
 
     def _check_rate_limit(self) -> bool:
         """Check if client is rate limited. Returns True if allowed."""
@@ -246,22 +618,18 @@ class ScoreboardHandler(BaseHTTPRequestHandler):
         if not self._check_rate_limit():
             return
 
-        parsed = urlparse.urlparse(self.path)
-        if parsed.path == "/healthz":
-            self.send_response(HTTPStatus.OK)
-            self._add_security_headers()
-            self.end_headers()
-            self.wfile.write(b"ok")
+        path, _, query = self.path.partition("?")
+        if path == "/healthz":
+            self._send_preformatted(
+                _HEALTHZ_RESPONSE_HEAD,
+                b"degraded: dispatch circuit open" if DISPATCH_BREAKER.is_open else b"ok",
+            )
             return
-        if parsed.path == "/":
-            limit, since = self._resolve_query_params(parsed.query)
-            payload = REPOSITORY.leaderboard(limit, since)
-            self._write_html(payload)
+        if path == "/":
+            self._serve_leaderboard("html", query)
             return
-        if parsed.path in ("/scoreboard", "/leaderboard"):
-            limit, since = self._resolve_query_params(parsed.query)
-            payload = REPOSITORY.leaderboard(limit, since)
-            self._write_json(payload)
+        if path in ("/scoreboard", "/leaderboard"):
+            self._serve_leaderboard("json", query)
             return
         self.send_error(HTTPStatus.NOT_FOUND, "Unknown path.")
 
@@ -269,6 +637,10 @@ class ScoreboardHandler(BaseHTTPRequestHandler):
         if not self._check_rate_limit():
             return
 
+        if self.path == "/scoreboard/batch":
+            self._handle_batch()
+            return
+
         if self.path != "/scoreboard":
             self.send_error(HTTPStatus.NOT_FOUND, "Unknown path.")
             return
@@ -279,54 +651,117 @@ class ScoreboardHandler(BaseHTTPRequestHandler):
         payload = self._read_json_body()
         if payload is None:
             return
+        if not isinstance(payload, dict):
+            self.send_error(HTTPStatus.BAD_REQUEST,
+                            "Request body must be a JSON object.")
+            return
 
-        line = payload.get("line")
+        # Work with the plain line from here on; dispatch() base64-encodes it
+        # only when forwarding to GitHub is actually enabled. A base64 line
+        # stays as UTF-8 bytes, which the JSON parser reads directly.
         encoded = payload.get("line_b64")
-        decoded_line: Optional[str] = None
-        if not encoded:
+        decoded_line: ScoreLine
+        if encoded:
+            try:
+                decoded_line = base64.b64decode(encoded, validate=True)
+            except (TypeError, ValueError) as exc:
+                self.send_error(HTTPStatus.BAD_REQUEST,
+                                f"Invalid base64 payload: {exc}")
+                return
+        else:
+            line = payload.get("line")
             if not isinstance(line, str):
                 self.send_error(HTTPStatus.BAD_REQUEST,
                                 "line or line_b64 required.")
                 return
             decoded_line = line
-            encoded = base64.b64encode(line.encode("utf-8")).decode("ascii")
-        if decoded_line is None:
-            try:
-                decoded_line = base64.b64decode(encoded).decode("utf-8")
-            except (ValueError, UnicodeDecodeError) as exc:
-                self.send_error(HTTPStatus.BAD_REQUEST,
-                                f"Invalid base64 payload: {exc}")
-                return
+
+        if _is_recent_submission(_submission_digest(decoded_line)):
+            self._send_preformatted(_QUEUED_RESPONSE_HEAD, b"queued",
+                                    status=HTTPStatus.ACCEPTED)
+            return
 
         try:
-            parsed_entry = json.loads(decoded_line)
+            parsed_entry = _json_loads(decoded_line)
         except json.JSONDecodeError as exc:
             self.send_error(HTTPStatus.BAD_REQUEST,
                             f"Payload is not valid JSON: {exc.msg}")
             return
+        except UnicodeDecodeError:
+            self.send_error(HTTPStatus.BAD_REQUEST,
+                            "Payload is not valid UTF-8.")
+            return
+        if not isinstance(parsed_entry, dict):
+            self.send_error(HTTPStatus.BAD_REQUEST,
+                            "Payload must be a JSON object.")
+            return
 
-        normalized_entry = normalize_entry(parsed_entry)
         try:
-            REPOSITORY.upsert_entry(normalized_entry)
-        except sqlite3.Error as exc:
-            LOGGER.error("Failed to persist scoreboard entry: %s", exc)
-            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR,
-                            "Failed to store entry.")
+            normalized_entry = normalize_entry(parsed_entry)
+        except ValueError as exc:
+            self.send_error(HTTPStatus.BAD_REQUEST, f"Invalid entry: {exc}")
+            return
+        try:
+            WRITE_QUEUE.put_nowait((normalized_entry, decoded_line))
+        except queue.Full:
+            LOGGER.warning("Write queue full; rejecting scoreboard entry")
+            self.send_error(HTTPStatus.SERVICE_UNAVAILABLE,
+                            "Scoreboard is busy, retry later.")
+            return
+
+        self._send_preformatted(_QUEUED_RESPONSE_HEAD, b"queued", status=HTTPStatus.ACCEPTED)
+
+    def _handle_batch(self) -> None:
+        """Store many scoreboard lines in one transaction.
+
+        Used by ``scripts/sync_scores.py`` to seed the database; batched
+        entries are persisted only and not forwarded to GitHub.
+        """
+        if not self._authorize():
+            return
+
+        payload = self._read_json_body(MAX_BATCH_PAYLOAD_BYTES)
+        if payload is None:
             return
 
-        dispatch_warning = None
+        lines = payload.get("lines") if isinstance(payload, dict) else None
+        if not isinstance(lines, list) or len(lines) > MAX_BATCH_LINES:
+            self.send_error(HTTPStatus.BAD_REQUEST,
+                            f"lines must be a list of at most {MAX_BATCH_LINES} entries.")
+            return
+
+        entries: list[ScoreEntryDict] = []
+        for index, line in enumerate(lines):
+            if not isinstance(line, str):
+                self.send_error(HTTPStatus.BAD_REQUEST,
+                                f"Line {index} must be a string.")
+                return
+            try:
+                parsed_entry = _json_loads(line)
+            except json.JSONDecodeError as exc:
+                self.send_error(HTTPStatus.BAD_REQUEST,
+                                f"Line {index} is not valid JSON: {exc.msg}")
+                return
+            if not isinstance(parsed_entry, dict):
+                self.send_error(HTTPStatus.BAD_REQUEST,
+                                f"Line {index} must be a JSON object.")
+                return
+            try:
+                entries.append(normalize_entry(parsed_entry))
+            except ValueError as exc:
+                self.send_error(HTTPStatus.BAD_REQUEST,
+                                f"Line {index} is not a valid entry: {exc}")
+                return
+
         try:
-            dispatch(encoded)
-        except RuntimeError as exc:
-            dispatch_warning = str(exc)
-            LOGGER.warning("Dispatch failed (entry stored in DB): %s", exc)
+            stored = REPOSITORY.upsert_many(entries)
+        except sqlite3.Error as exc:
+            LOGGER.error("Failed to persist scoreboard batch: %s", exc)
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR,
+                            "Failed to store entries.")
+            return
 
-        self.send_response(HTTPStatus.ACCEPTED)
-        if dispatch_warning:
-            self.send_header("X-Dispatch-Status", "failed")
-        self._add_security_headers()
-        self.end_headers()
-        self.wfile.write(b"queued")
+        self._write_json({"stored": stored})
 
     def log_message(self, format: str, *args: object):
         LOGGER.info("%s - - %s", self.address_string(), format % args)
@@ -341,124 +776,144 @@ class ScoreboardHandler(BaseHTTPRequestHandler):
         if not query:
             return LEADERBOARD_LIMIT_DEFAULT, None
 
-        params = urlparse.parse_qs(query)
-
-        # Parse limit
+        # Only the first occurrence of each parameter counts; like
+        # parse_qsl, fields without a value are skipped.
         limit = LEADERBOARD_LIMIT_DEFAULT
-        limit_value = params.get("limit")
-        if limit_value:
-            try:
-                limit = max(1, min(100, int(limit_value[0])))
-            except (TypeError, ValueError):
-                pass
+        limit_seen = False
+        since_str: Optional[str] = None
+        for pair in query.split("&"):
+            key, _, value = pair.partition("=")
+            if not value:
+                continue
+            if key == "limit" and not limit_seen:
+                limit = _resolve_limit(_unquote(value))
+                limit_seen = True
+            elif key == "since" and since_str is None:
+                since_str = _unquote(value).lower()
 
         # Parse since parameter
         since = None
-        since_value = params.get("since")
-        if since_value:
-            since_str = since_value[0].lower()
-            now = datetime.now(timezone.utc)
-
+        if since_str:
             # Handle relative time ranges
-            if since_str == "today":
-                since = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-            elif since_str == "week":
-                from datetime import timedelta
-                since = (now - timedelta(days=7)).isoformat()
-            elif since_str == "month":
-                from datetime import timedelta
-                since = (now - timedelta(days=30)).isoformat()
+            relative = _RELATIVE_SINCE.get(since_str)
+            if relative is not None:
+                since = relative(datetime.now(timezone.utc)).isoformat()
             else:
                 # Assume it's an ISO timestamp
                 since = since_str
 
         return limit, since
 
+    def _serve_leaderboard(self, kind: str, query: str) -> None:
+        """Serve the leaderboard as HTML or JSON from the rendered-bytes cache.
+
+        Clients revalidate with ``If-None-Match`` and get a bodiless 304 while
+        the scoreboard is unchanged.
+        """
+        key = (kind, query)
+        version = REPOSITORY.version
+        now = time.monotonic()
+        with _RESPONSE_CACHE_LOCK:
+            cached = _RESPONSE_CACHE.get(key)
+            if cached is not None:
+                _RESPONSE_CACHE.move_to_end(key)
+        if (
+            cached is not None
+            and cached[0] == version
+            and now - cached[1] < REPOSITORY.LEADERBOARD_CACHE_TTL
+        ):
+            etag, body = cached[2], cached[3]
+        else:
+            limit, since = self._resolve_query_params(query)
+            payload = REPOSITORY.leaderboard_cached(limit, since)
+            if kind == "html":
+                body = self._render_html(payload)
+            else:
+                body = _json_dumps(payload)
+            # Hash the bytes themselves: writes made outside this process and
+            # rolling relative windows change the body without bumping version
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[key] = (version, now, etag, body)
+                _RESPONSE_CACHE.move_to_end(key)
+                # Evict the least recently served query
+                if len(_RESPONSE_CACHE) > RESPONSE_CACHE_MAX_ENTRIES:
+                    _RESPONSE_CACHE.popitem(last=False)
+
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag in (tag.strip() for tag in if_none_match.split(","))
+        ):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            if self.close_connection:
+                self.send_header("Connection", "close")
+            self._add_security_headers()
+            self.end_headers()
+            return
+
+        if kind == "html":
+            self._send_preformatted(_HTML_RESPONSE_HEAD, body, etag)
+        else:
+            self._send_preformatted(_JSON_RESPONSE_HEAD, body, etag)
+
     def _write_json(self, payload: dict[str, object]) -> None:
-        body = json.dumps(payload).encode("utf-8")
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Cache-Control", "no-store")
-        self._add_security_headers()
-        self.end_headers()
-        self.wfile.write(body)
-
-    def _write_html(self, payload: Dict[str, object]) -> None:
+        self._send_preformatted(_JSON_NO_STORE_RESPONSE_HEAD, _json_dumps(payload))
+
+    def _render_html(self, payload: Dict[str, object]) -> bytes:
         top_entries = cast(Iterable[EntryMapping], payload.get("topLevels", []))
         fast_entries = cast(Iterable[EntryMapping], payload.get("fastestRuns", []))
         top_html = self._render_table(top_entries, show_levels=True, tbody_id="top-levels-body")
         fast_html = self._render_table(fast_entries, show_levels=False, tbody_id="fastest-runs-body")
-        document = (
-            HTML_TEMPLATE
-            .replace("{{TOP_LEVELS}}", top_html, 1)
-            .replace("{{FASTEST_RUNS}}", fast_html, 1)
-        )
-        body = document.encode("utf-8")
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Cache-Control", "no-store")
-
-        # Add CSP for HTML pages - allow necessary external resources
-        self.send_header("Content-Security-Policy",
-                        "default-src 'none'; "
-                        "script-src 'unsafe-inline'; "
-                        "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; "
-                        "img-src 'self' data: https://api.qrserver.com; "
-                        "font-src 'self' https://fonts.gstatic.com; "
-                        "connect-src 'self'")
-
-        self._add_security_headers()
-        self.end_headers()
-        self.wfile.write(body)
+        return b"".join((HTML_PREFIX, top_html, HTML_MIDDLE, fast_html, HTML_SUFFIX))
 
     @staticmethod
     def _render_table(
         entries: Iterable[EntryMapping], show_levels: bool, tbody_id: str = ""
-    ) -> str:
-        header_main = "<th>Levels</th>" if show_levels else "<th>Run Time</th>"
-        header_aux = "<th>Run Time</th>" if show_levels else "<th>Levels</th>"
+    ) -> bytes:
+        # Pick the column order once; rows then only fill in a template.
+        if show_levels:
+            header = "<th>Levels</th><th>Run Time</th>"
+            row_fmt = "<tr><td>{0}</td><td>{1}</td><td>{2}</td><td>{3}</td></tr>"
+        else:
+            header = "<th>Run Time</th><th>Levels</th>"
+            row_fmt = "<tr><td>{0}</td><td>{1}</td><td>{3}</td><td>{2}</td></tr>"
         tbody_tag = f'<tbody id="{tbody_id}">' if tbody_id else "<tbody>"
-        rows = [
-            "<table>",
-            "<thead><tr><th>#</th><th>Initials</th>",
-            header_main,
-            header_aux,
-            "</tr></thead>",
-            tbody_tag
-        ]
-
-        if not entries:
+        format_duration = ScoreboardHandler._format_duration
+
+        body = "".join(
+            row_fmt.format(
+                idx,
+                str(entry["initials"]).translate(_HTML_ESCAPE_TABLE),
+                entry["level"],
+                format_duration(entry["runTimeTicks"]),
+            )
+            for idx, entry in enumerate(entries, start=1)
+        )
+        if not body:
             # Render empty tbody with message but keep table structure intact
-            rows.append('<tr><td colspan="4" class="empty-message">No runs recorded yet.</td></tr>')
-        else:
-            for idx, entry in enumerate(entries, start=1):
-                initials_raw = str(entry.get("initials", "???"))
-                initials = html.escape(initials_raw)
-                levels = int(str(entry.get("level", 0)))
-                run_time_ticks = entry.get("runTimeTicks", 0)
-                run_time = ScoreboardHandler._format_duration(run_time_ticks)
-                if show_levels:
-                    rows.append(
-                        f"<tr><td>{idx}</td><td>{initials}</td><td>{levels}</td><td>{run_time}</td></tr>")
-                else:
-                    rows.append(
-                        f"<tr><td>{idx}</td><td>{initials}</td><td>{run_time}</td><td>{levels}</td></tr>")
-
-        rows.append("</tbody></table>")
-        return "".join(rows)
+            body = '<tr><td colspan="4" class="empty-message">No runs recorded yet.</td></tr>'
+
+        return (
+            "<table><thead><tr><th>#</th><th>Initials</th>"
+            f"{header}</tr></thead>{tbody_tag}{body}</tbody></table>"
+        ).encode("utf-8")
 
     @staticmethod
     def _format_duration(ticks: object) -> str:
-        try:
-            total_seconds = float(str(ticks)) / 10_000_000
-        except (TypeError, ValueError):
-            return "00:00.000"
-        minutes = int(total_seconds // 60)
-        seconds = total_seconds % 60
-        return f"{minutes:02d}:{seconds:06.3f}"
+        # Numbers from SQLite are used directly; anything else is parsed
+        if type(ticks) is not int and type(ticks) is not float:
+            try:
+                ticks = float(str(ticks))
+            except (TypeError, ValueError):
+                return "00:00.000"
+        minutes, seconds = divmod(ticks / 10_000_000, 60)
+        return f"{int(minutes):02d}:{seconds:06.3f}"
 
     def _authorize(self) -> bool:
-        if CONFIG.secret is None:
+        if CONFIG.secret_digest is None:
             LOGGER.critical(
                 "⚠️  AUTHENTICATION DISABLED! SCOREBOARD_SECRET not set. "
                 "Anyone can POST scores to this endpoint. "
@@ -476,7 +931,11 @@ class ScoreboardHandler(BaseHTTPRequestHandler):
                             "Missing X-Scoreboard-Secret header.")
             return False
 
-        if not secrets.compare_digest(provided.strip(), CONFIG.secret):
+        # http.server decodes header bytes as Latin-1, so this recovers the
+        # raw bytes the client sent (and never fails on non-ASCII input).
+        if not secrets.compare_digest(
+            _secret_digest(provided.strip().encode("latin-1")), CONFIG.secret_digest
+        ):
             LOGGER.warning(
                 "Failed authentication attempt from IP: %s, User-Agent: %s",
                 self.client_address[0],
@@ -487,7 +946,7 @@ class ScoreboardHandler(BaseHTTPRequestHandler):
             return False
         return True
 
-    def _read_json_body(self):
+    def _read_json_body(self, max_bytes: int = MAX_PAYLOAD_BYTES):
         length_header = self.headers.get("Content-Length")
         if length_header is None:
             self.send_error(HTTPStatus.LENGTH_REQUIRED,
@@ -500,65 +959,476 @@ class ScoreboardHandler(BaseHTTPRequestHandler):
                             "Invalid Content-Length header.")
             return None
 
-        if length <= 0 or length > MAX_PAYLOAD_BYTES:
+        if length <= 0 or length > max_bytes:
             self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
                             "Payload too large.")
             return None
 
-        raw = self.rfile.read(length)
+        if length <= MAX_PAYLOAD_BYTES:
+            # Small bodies are read into a per-thread buffer that pool workers
+            # reuse across requests instead of allocating a new bytes object.
+            buffer = getattr(_READ_BUFFERS, "buffer", None)
+            if buffer is None:
+                buffer = _READ_BUFFERS.buffer = bytearray(MAX_PAYLOAD_BYTES)
+            view = memoryview(buffer)
+            received = self.rfile.readinto(view[:length])
+            raw: JsonInput = view[:received]
+        else:
+            raw = self.rfile.read(length)
+        if not self._pool_server.clear_read_deadline(self.connection):
+            LOGGER.warning("Dropping request from %s: body not received in time",
+                           self.client_address[0])
+            self.close_connection = True
+            return None
         try:
-            return json.loads(raw)
+            return _json_loads(raw)
         except json.JSONDecodeError:
             self.send_error(HTTPStatus.BAD_REQUEST,
                             "Request body must be valid JSON.")
             return None
 
 
-def dispatch(encoded_line: str) -> None:
-    if not CONFIG.repo or not CONFIG.token:
+def _submission_digest(line: ScoreLine) -> bytes:
+    return hashlib.blake2b(
+        line if isinstance(line, bytes) else line.encode("utf-8"), digest_size=16
+    ).digest()
+
+
+def _is_recent_submission(digest: bytes) -> bool:
+    """Return whether an identical line was queued within the duplicate window."""
+    with _RECENT_SUBMISSIONS_LOCK:
+        seen_at = _RECENT_SUBMISSIONS.get(digest)
+        if seen_at is None:
+            return False
+        if time.monotonic() - seen_at >= DUPLICATE_WINDOW_SECONDS:
+            del _RECENT_SUBMISSIONS[digest]
+            return False
+        return True
+
+
+def _remember_submission(digest: bytes) -> None:
+    with _RECENT_SUBMISSIONS_LOCK:
+        _RECENT_SUBMISSIONS[digest] = time.monotonic()
+        _RECENT_SUBMISSIONS.move_to_end(digest)
+        if len(_RECENT_SUBMISSIONS) > RECENT_SUBMISSIONS_MAX:
+            _RECENT_SUBMISSIONS.popitem(last=False)
+
+
+def _response_head(*headers: Tuple[str, str], status: HTTPStatus = HTTPStatus.OK) -> bytes:
+    """Serialize the status line and fixed headers of a response."""
+    handler = ScoreboardHandler
+    lines = [
+        f"{handler.protocol_version} {status.value} {status.phrase}",
+        f"Server: {handler.server_version} {handler.sys_version}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in headers + SECURITY_HEADERS)
+    return ("\r\n".join(lines) + "\r\n").encode("latin-1")
+
+
+_HTML_RESPONSE_HEAD = _response_head(
+    ("Content-Type", "text/html; charset=utf-8"),
+    # Add CSP for HTML pages - allow necessary external resources
+    ("Content-Security-Policy", HTML_CONTENT_SECURITY_POLICY),
+    ("Cache-Control", "no-cache"),
+)
+_JSON_RESPONSE_HEAD = _response_head(
+    ("Content-Type", "application/json; charset=utf-8"),
+    ("Cache-Control", "no-cache"),
+)
+_HEALTHZ_RESPONSE_HEAD = _response_head()
+_JSON_NO_STORE_RESPONSE_HEAD = _response_head(
+    ("Content-Type", "application/json; charset=utf-8"),
+    ("Cache-Control", "no-store"),
+)
+_QUEUED_RESPONSE_HEAD = _response_head(status=HTTPStatus.ACCEPTED)
+_BUSY_RESPONSE = _response_head(
+    ("Content-Type", "text/plain; charset=utf-8"),
+    ("Content-Length", "5"),
+    ("Retry-After", "1"),
+    ("Connection", "close"),
+    status=HTTPStatus.SERVICE_UNAVAILABLE,
+) + b"\r\nbusy\n"
+
+# Each dispatching thread keeps its own keep-alive connection to the API so
+# consecutive dispatches and retries skip the TCP/TLS handshake.
+_DISPATCH_CONNECTIONS = threading.local()
+
+
+def _dispatch_connection(parsed_url: urlparse.ParseResult) -> http.client.HTTPConnection:
+    conn = getattr(_DISPATCH_CONNECTIONS, "conn", None)
+    if conn is None:
+        if parsed_url.scheme == "https":
+            conn = http.client.HTTPSConnection(parsed_url.netloc, timeout=15)
+        else:
+            conn = http.client.HTTPConnection(parsed_url.netloc, timeout=15)
+        _DISPATCH_CONNECTIONS.conn = conn
+    return conn
+
+
+def _close_dispatch_connection() -> None:
+    conn = getattr(_DISPATCH_CONNECTIONS, "conn", None)
+    if conn is not None:
+        conn.close()
+        _DISPATCH_CONNECTIONS.conn = None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the wait requested by a ``Retry-After`` header, in seconds.
+
+    Both the delta-seconds and HTTP-date forms are accepted; the result is
+    capped at ``RETRY_AFTER_MAX_SECONDS`` so a worker is never parked for long.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    if seconds != seconds:
+        return None
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX_SECONDS)
+
+
+def dispatch(line: ScoreLine) -> None:
+    dispatch_batch([line])
+
+
+def dispatch_batch(lines: Sequence[ScoreLine]) -> None:
+    """Forward scoreboard lines to GitHub in a single repository_dispatch.
+
+    A single line keeps the original ``line_b64`` payload shape; more lines
+    are sent as a ``lines_b64`` array.
+    """
+    parsed_url = _DISPATCH_URL
+    if parsed_url is None or not CONFIG.token or not lines:
         return
-    url = f"{CONFIG.api_base}/repos/{CONFIG.repo.strip('/')}/dispatches"
-    parsed_url = urlparse.urlparse(url)
     if parsed_url.scheme not in ("http", "https"):
         raise RuntimeError(f"Unsupported URL scheme for GitHub dispatch: {parsed_url.scheme}")
-    payload: dict[str, str | dict[str, str]] = {
-        "event_type": CONFIG.event_type,
-        "client_payload": {"line_b64": encoded_line},
-    }
-    body = json.dumps(payload).encode("utf-8")
+    # Only the lines change between calls, and base64 output never needs
+    # JSON escaping, so it is spliced straight into the precomputed body.
+    encoded_lines = [
+        base64.b64encode(line if isinstance(line, bytes) else line.encode("utf-8"))
+        for line in lines
+    ]
+    if len(encoded_lines) == 1:
+        body = b"".join((_DISPATCH_BODY_PREFIX, b'"', encoded_lines[0], b'"}}'))
+    else:
+        body = b"".join((
+            _DISPATCH_BATCH_BODY_PREFIX, b'["', b'", "'.join(encoded_lines), b'"]}}'
+        ))
+    if not DISPATCH_BREAKER.allow():
+        raise CircuitOpenError("GitHub dispatch circuit is open.")
 
     backoff = 1.0
     for attempt in range(5):
-        req = urlrequest.Request(url, data=body, method="POST")
-        req.add_header("Accept", "application/vnd.github+json")
-        req.add_header("Authorization", f"token {CONFIG.token}")
-        req.add_header("Content-Type", "application/json")
-        req.add_header("User-Agent", "stackoverflow-minigame-webhook/1.0")
-
+        retry_after: Optional[float] = None
+        conn = _dispatch_connection(parsed_url)
         try:
-            with urlrequest.urlopen(req, timeout=15) as resp:
-                resp.read()
-            return
-        except urlerror.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="replace")
-            LOGGER.error("GitHub dispatch failed (attempt %s/5): %s %s %s",
-                         attempt + 1, exc.code, exc.reason, detail)
-            if 400 <= exc.code < 500 and exc.code != 429:
-                raise RuntimeError(
-                    f"GitHub dispatch failed: {exc.code} {exc.reason} - {detail}") from exc
-        except urlerror.URLError as exc:
+            conn.request("POST", parsed_url.path, body=body, headers=_DISPATCH_HEADERS)
+            resp = conn.getresponse()
+            raw_detail = resp.read()
+        except (OSError, http.client.HTTPException) as exc:
+            # The server may have dropped an idle keep-alive connection
+            _close_dispatch_connection()
             LOGGER.error(
                 "Network error while calling GitHub (attempt %s/5): %s", attempt + 1, exc)
-
-        time.sleep(backoff)
+        else:
+            if resp.will_close:
+                _close_dispatch_connection()
+            if 200 <= resp.status < 300:
+                DISPATCH_BREAKER.record_success()
+                return
+            detail = raw_detail.decode("utf-8", errors="replace")
+            LOGGER.error("GitHub dispatch failed (attempt %s/5): %s %s %s",
+                         attempt + 1, resp.status, resp.reason, detail)
+            if 400 <= resp.status < 500 and resp.status not in RETRYABLE_CLIENT_ERRORS:
+                raise RuntimeError(
+                    f"GitHub dispatch failed: {resp.status} {resp.reason} - {detail}")
+            if resp.status in (429, 503):
+                retry_after = _parse_retry_after(resp.getheader("Retry-After"))
+
+        if attempt == 4:
+            break
+        # Full jitter keeps concurrent retries from hitting GitHub in lockstep
+        delay = random.uniform(0, backoff)
+        if retry_after is not None:
+            # GitHub's own hint is a floor; jitter only ever adds to it
+            delay = max(delay, retry_after)
+        time.sleep(delay)
         backoff = min(backoff * 2, 10)
 
+    # Only exhausted retries count against the breaker; a non-retryable 4xx
+    # means GitHub is up and rejected this particular request.
+    DISPATCH_BREAKER.record_failure()
     raise RuntimeError(
         "GitHub dispatch failed after multiple attempts. Check webhook logs for details.")
 
 
+WRITE_QUEUE: "queue.Queue[Optional[Tuple[ScoreEntryDict, ScoreLine]]]" = queue.Queue(
+    maxsize=WRITE_QUEUE_MAX
+)
+_write_worker: Optional[threading.Thread] = None
+DISPATCH_QUEUE: "queue.Queue[Optional[list[ScoreLine]]]" = queue.Queue(
+    maxsize=DISPATCH_QUEUE_MAX
+)
+_dispatch_workers: list[threading.Thread] = []
+# Set on shutdown so workers stop holding chunks for an open circuit
+_DISPATCH_STOPPING = threading.Event()
+
+
+def _flush_writes(batch: list[Tuple[ScoreEntryDict, ScoreLine]]) -> None:
+    """Store a batch of queued entries in one transaction and queue their dispatch."""
+    try:
+        REPOSITORY.upsert_many(entry for entry, _ in batch)
+    except Exception as exc:  # noqa: BLE001
+        # Nothing unstored is forwarded; the client's retry is stored and
+        # dispatched as a fresh submission
+        LOGGER.error("Failed to persist %d scoreboard entries: %s", len(batch), exc)
+        return
+    # Only committed lines count as duplicates, so a retry of a lost write is
+    # stored instead of being acknowledged and dropped
+    for _, line in batch:
+        _remember_submission(_submission_digest(line))
+
+    if not CONFIG.repo or not CONFIG.token:
+        return
+    lines = [line for _, line in batch]
+    for start in range(0, len(lines), DISPATCH_CHUNK_SIZE):
+        chunk = lines[start:start + DISPATCH_CHUNK_SIZE]
+        try:
+            DISPATCH_QUEUE.put_nowait(chunk)
+        except queue.Full:
+            LOGGER.warning("Dispatch queue full; %d entries stored but not forwarded",
+                           len(chunk))
+
+
+def _dispatch_when_allowed(batch: list[ScoreLine]) -> None:
+    """Dispatch ``batch``, holding on to it while the circuit breaker is open.
+
+    Held chunks back up DISPATCH_QUEUE, and once that is full new entries
+    are stored without being forwarded rather than buffered without bound.
+    On shutdown a held chunk is dropped instead of waiting for the circuit.
+    """
+    while True:
+        try:
+            dispatch_batch(batch)
+        except CircuitOpenError:
+            if _DISPATCH_STOPPING.wait(max(DISPATCH_BREAKER.seconds_until_retry(), 0.1)):
+                LOGGER.warning("Shutting down with the dispatch circuit open; "
+                               "%d stored entries not forwarded", len(batch))
+                return
+            continue
+        except RuntimeError as exc:
+            LOGGER.warning("Dispatch of %d entries failed: %s", len(batch), exc)
+        return
+
+
+def _run_dispatch_worker() -> None:
+    """Forward queued line chunks to GitHub until the shutdown sentinel arrives.
+
+    When batching is enabled, chunks arriving shortly after the first one are
+    merged into it, so a burst spread over several write batches still costs
+    one API call.
+    """
+    while True:
+        chunk = DISPATCH_QUEUE.get()
+        if chunk is None:
+            return
+        lines = list(chunk)
+        stopping = False
+        deadline = time.monotonic() + DISPATCH_COALESCE_SECONDS
+        while len(lines) < DISPATCH_CHUNK_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                chunk = DISPATCH_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if chunk is None:
+                stopping = True
+                break
+            lines.extend(chunk)
+        for start in range(0, len(lines), DISPATCH_CHUNK_SIZE):
+            _dispatch_when_allowed(lines[start:start + DISPATCH_CHUNK_SIZE])
+        if stopping:
+            return
+
+
+def _run_write_worker() -> None:
+    """Drain the write queue until the shutdown sentinel arrives.
+
+    Whatever is already queued behind the first entry is folded into the
+    same batch, so bursts share one commit without delaying a lone write.
+    """
+    while True:
+        item = WRITE_QUEUE.get()
+        if item is None:
+            return
+        batch = [item]
+        stopping = False
+        while len(batch) < WRITE_BATCH_MAX:
+            try:
+                item = WRITE_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        try:
+            _flush_writes(batch)
+        except Exception:  # noqa: BLE001
+            # This is the only writer; losing it would silently drop every later entry
+            LOGGER.exception("Unexpected error while flushing %d scoreboard entries",
+                             len(batch))
+        if stopping:
+            return
+
+
+def start_background_workers() -> None:
+    """Start the threads that persist and dispatch queued entries."""
+    global _write_worker
+    if _write_worker is not None and _write_worker.is_alive():
+        return
+    _write_worker = threading.Thread(
+        target=_run_write_worker, name="scoreboard-writer", daemon=True
+    )
+    _write_worker.start()
+    _DISPATCH_STOPPING.clear()
+    for index in range(DISPATCH_WORKERS):
+        worker = threading.Thread(
+            target=_run_dispatch_worker, name=f"scoreboard-dispatch-{index}", daemon=True
+        )
+        worker.start()
+        _dispatch_workers.append(worker)
+
+
+def stop_background_workers(timeout: Optional[float] = None) -> None:
+    """Flush pending entries, then stop the writer and dispatch threads."""
+    global _write_worker
+    if _write_worker is None:
+        return
+    WRITE_QUEUE.put(None)
+    _write_worker.join(timeout)
+    if _write_worker.is_alive():
+        LOGGER.warning("Writer did not finish; %d entries left unsaved",
+                       WRITE_QUEUE.qsize())
+    _write_worker = None
+
+    # The writer has queued its last dispatches; one sentinel per worker
+    # lets them finish what is ahead of it, minus anything held for an open
+    # circuit.
+    _DISPATCH_STOPPING.set()
+    for _ in _dispatch_workers:
+        DISPATCH_QUEUE.put(None)
+    for worker in _dispatch_workers:
+        worker.join(timeout)
+        if worker.is_alive():
+            LOGGER.warning("Dispatch worker %s did not finish", worker.name)
+    _dispatch_workers.clear()
+
+
 class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """HTTP server that handles requests on a fixed pool of worker threads.
+
+    When every worker is busy a new connection gets an immediate 503 rather
+    than a fresh thread or a stalled accept loop. Because ``timeout`` only
+    bounds each socket read, the accept loop also cuts off connections that
+    take longer than ``read_deadline`` seconds to send their request line,
+    headers and body, so trickling clients cannot hold workers indefinitely.
+    """
+
     daemon_threads = True
+    request_queue_size = 64
+    max_workers = 32
+    read_deadline = 10.0
+
+    def __init__(self, *args, max_workers: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if max_workers is not None:
+            self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="scoreboard-http"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._read_deadlines: Dict[socket.socket, float] = {}
+        self._read_deadlines_lock = threading.Lock()
+        self._expired_reads: set[socket.socket] = set()
+
+    def start_read_deadline(self, connection: socket.socket) -> None:
+        with self._read_deadlines_lock:
+            self._read_deadlines[connection] = time.monotonic() + self.read_deadline
+
+    def read_deadline_expired(self, connection: socket.socket) -> bool:
+        with self._read_deadlines_lock:
+            return connection in self._expired_reads
+
+    def clear_read_deadline(self, connection: socket.socket) -> bool:
+        """Stop timing ``connection``; return False if its deadline already passed."""
+        with self._read_deadlines_lock:
+            self._read_deadlines.pop(connection, None)
+            if connection in self._expired_reads:
+                self._expired_reads.discard(connection)
+                return False
+            return True
+
+    def service_actions(self) -> None:
+        """Shut down connections still sending a request past their deadline.
+
+        Runs on the serve_forever thread between polls; shutting down the read
+        side makes the worker's blocked read return, and the handler then
+        drops the truncated request without answering it.
+        """
+        super().service_actions()
+        now = time.monotonic()
+        with self._read_deadlines_lock:
+            expired = [conn for conn, deadline in self._read_deadlines.items()
+                       if deadline <= now]
+            for conn in expired:
+                del self._read_deadlines[conn]
+            self._expired_reads.update(expired)
+        for conn in expired:
+            try:
+                conn.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+
+    def process_request(self, request, client_address):
+        # Never block the accept loop: slow or idle clients holding every
+        # worker must not stop new connections from getting an answer.
+        if not self._slots.acquire(blocking=False):
+            LOGGER.warning("All %d workers busy; rejecting connection from %s",
+                           self.max_workers, client_address[0])
+            try:
+                request.sendall(_BUSY_RESPONSE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        try:
+            self._pool.submit(self._process_in_pool, request, client_address)
+        except RuntimeError:
+            # Pool already shut down
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process_in_pool(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False)
 
 
 def build_server():
@@ -567,19 +1437,54 @@ def build_server():
     port_value = os.environ.get(PORT_ENV) or os.environ.get(
         FALLBACK_PLATFORM_PORT_ENV) or "8080"
     port = int(port_value)
-    httpd = ThreadingHTTPServer((host, port), ScoreboardHandler)
+    httpd = ThreadingHTTPServer(
+        (host, port), ScoreboardHandler, bind_and_activate=False,
+        max_workers=resolve_http_threads(),
+    )
+    try:
+        # Accepted connections inherit these from the listening socket; the
+        # receive buffer only sets their window scale if applied before listen()
+        for env_name, option in ((RCVBUF_ENV, socket.SO_RCVBUF), (SNDBUF_ENV, socket.SO_SNDBUF)):
+            size = resolve_socket_buffer(env_name)
+            if size is not None:
+                httpd.socket.setsockopt(socket.SOL_SOCKET, option, size)
+                LOGGER.info("Set %s to %d bytes", env_name, size)
+        httpd.server_bind()
+        httpd.server_activate()
+    except BaseException:
+        httpd.server_close()
+        raise
     LOGGER.info("Listening on http://%s:%s/scoreboard", host, port)
+    LOGGER.info("Handling requests on %d worker threads (set %s to change)",
+                httpd.max_workers, HTTP_THREADS_ENV)
     if host == "127.0.0.1":
         LOGGER.info("🔒 Bound to localhost only - set SCOREBOARD_HOST=0.0.0.0 for network access")
     return httpd
 
 
+def _run_periodic_tasks(stop: threading.Event) -> None:
+    """Clean up the rate limiter and checkpoint/optimize SQLite on a timer."""
+    last_maintenance = time.monotonic()
+    while not stop.wait(CLEANUP_INTERVAL_SECONDS):
+        RATE_LIMITER.cleanup_old_entries()
+        now = time.monotonic()
+        if now - last_maintenance >= MAINTENANCE_INTERVAL_SECONDS:
+            try:
+                REPOSITORY.maintain()
+            except sqlite3.Error as exc:
+                LOGGER.warning("SQLite maintenance failed: %s", exc)
+            last_maintenance = now
+
+
 def main():
     LOGGER.info("Loaded configuration: repo=%s event=%s api_base=%s secret=%s",
                 CONFIG.repo, CONFIG.event_type, CONFIG.api_base, "set" if CONFIG.secret else "unset")
-    LOGGER.info("Using SQLite database at %s", REPOSITORY.path)
+    LOGGER.info("Using SQLite database at %s (journal_mode=%s)",
+                REPOSITORY.path, REPOSITORY.journal_mode)
     LOGGER.info("Rate limiting enabled: %d requests per %d seconds per IP",
                 RATE_LIMITER.max_requests, RATE_LIMITER.window_seconds)
+    LOGGER.info("Forwarding up to %d entries per dispatch (set %s=true to batch)",
+                DISPATCH_CHUNK_SIZE, DISPATCH_BATCH_ENV)
 
     # Security warning if authentication is disabled
     if CONFIG.secret:
@@ -594,24 +1499,23 @@ def main():
         LOGGER.critical("=" * 80)
 
     server = build_server()
+    start_background_workers()
 
-    # Periodically clean up rate limiter
-    last_cleanup = time.time()
-    cleanup_interval = 300  # 5 minutes
+    # Periodically clean up rate limiter and checkpoint/optimize SQLite
+    stop_periodic = threading.Event()
+    threading.Thread(
+        target=_run_periodic_tasks, args=(stop_periodic,),
+        name="scoreboard-maintenance", daemon=True,
+    ).start()
 
     try:
         LOGGER.info("Server started - press Ctrl+C to stop")
-        while True:
-            server.handle_request()
-
-            # Cleanup rate limiter periodically
-            now = time.time()
-            if now - last_cleanup > cleanup_interval:
-                RATE_LIMITER.cleanup_old_entries()
-                last_cleanup = now
+        server.serve_forever()
     except KeyboardInterrupt:
         LOGGER.info("Shutting down…")
+        stop_periodic.set()
         server.server_close()
+        stop_background_workers()
 
 
 if __name__ == "__main__":